@@ -1,24 +1,52 @@
 import io
 import logging
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 
 import boto3
+import numpy as np
+import pandas as pd
+from botocore.config import Config
 
-
-class DataExtractor:
-    # Configure logging.
+# Configure logging once at import. The Lambda runtime pre-installs a root handler,
+# in which case only the level is raised so its handler is not shadowed.
+_ROOT_LOGGER = logging.getLogger()
+if _ROOT_LOGGER.handlers:
+    _ROOT_LOGGER.setLevel(logging.INFO)
+else:
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s %(name)s %(levelname)s %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
+# Shared S3 client, built once per Lambda container at import (before any handler
+# thread runs, since boto3 client creation is not thread-safe) and reused across
+# warm invocations.
+_S3_CLIENT = boto3.client(
+    "s3",
+    config=Config(
+        tcp_keepalive=True,
+        max_pool_connections=50,
+        connect_timeout=3,
+        read_timeout=30,
+        retries={"max_attempts": 3, "mode": "standard"},
+        # Avoid the us-east-1 global endpoint redirect.
+        s3={"us_east_1_regional_endpoint": "regional"},
+    ),
+)
+
+
+class DataExtractor:
     def __init__(self) -> None:
-        self.logger = logging.getLogger(self.__class__.__name__)
+        class_name = type(self).__name__
+        self._name = class_name.lower()
+        self.logger = logging.getLogger(class_name)
         self.df = None
         self.S3_BUCKET_NAME = os.environ.get("S3_BUCKET_NAME", "etl-bucket-ag")
-        self.S3_FOLDER = f"{self.__class__.__name__.lower()}_data/"
+        # One of "parquet", "csv" or "csv.gz" (see load()).
+        self.OUTPUT_FORMAT = os.environ.get("OUTPUT_FORMAT", "parquet")
+        self.S3_FOLDER = f"{self._name}_data/"
 
     def extract(self) -> None:
         raise NotImplementedError("Extract Method Not Implemented.")
@@ -26,19 +54,53 @@ class DataExtractor:
     def transform(self) -> None:
         raise NotImplementedError("Transform Method Not Implemented.")
 
-    def load(self) -> None:
+    def add_metadata(self, df: pd.DataFrame) -> pd.DataFrame:
+        # Constant columns are stored as single-category Categoricals (int8 codes).
+        codes = np.zeros(len(df), dtype=np.int8)
+        for key, val in self.METADATA.items():
+            df[key] = pd.Categorical.from_codes(codes, categories=[val])
+        return df
+
+    def load(self, fmt: str = "parquet") -> None:
         self.logger.info("Initiating the Data Loading Method.")
 
-        s3 = boto3.client("s3")
-        csv_buffer = io.StringIO()
-        output_filename = f'{self.__class__.__name__.lower()}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-        self.df.to_csv(csv_buffer, index=False)
+        s3 = _S3_CLIENT
+        buffer = io.BytesIO()
+        extra_args = {}
+        # UTC keeps keys consistent regardless of the region the Lambda runs in.
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+
+        if fmt == "parquet":
+            extension = "parquet"
+            content_type = "application/octet-stream"
+            self.df.to_parquet(
+                buffer, engine="pyarrow", compression="snappy", index=False
+            )
+        elif fmt == "csv":
+            extension = "csv"
+            content_type = "text/csv"
+            self.df.to_csv(buffer, index=False, encoding="utf-8")
+        elif fmt == "csv.gz":
+            extension = "csv.gz"
+            content_type = "text/csv"
+            extra_args["ContentEncoding"] = "gzip"
+            # Fastest gzip level; Lambda CPU is the scarcer resource here.
+            self.df.to_csv(
+                buffer,
+                index=False,
+                encoding="utf-8",
+                compression={"method": "gzip", "compresslevel": 1},
+            )
+        else:
+            raise ValueError(f"Unsupported output format: {fmt}")
+        buffer.seek(0)
 
-        s3.put_object(
-            Bucket=self.S3_BUCKET_NAME,
-            Key=os.path.join(self.S3_FOLDER, output_filename),
-            Body=csv_buffer.getvalue().encode("utf-8"),
-            ContentType="text/csv",
+        # upload_fileobj streams the buffer and switches to multipart for large payloads.
+        s3.upload_fileobj(
+            buffer,
+            self.S3_BUCKET_NAME,
+            f"{self.S3_FOLDER}{self._name}_{timestamp}.{extension}",
+            ExtraArgs={"ContentType": content_type, **extra_args},
         )
 
         self.logger.info("DataFrame Uploaded to S3 Successfully.")
@@ -57,6 +119,6 @@ class DataExtractor:
                 f"Scraper failed at Transformation. Error was {err}"
             ) from err
         try:
-            self.load()
+            self.load(self.OUTPUT_FORMAT)
         except Exception as err:
             raise RuntimeError(f"Scraper failed at Upload. Error was {err}") from err
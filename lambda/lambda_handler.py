@@ -1,10 +1,39 @@
-import random
+import io
+from concurrent.futures import ThreadPoolExecutor
 
+import lxml.html
+import numpy as np
+import orjson
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from base_class import DataExtractor
 
+# Shared HTTP session, reused across warm invocations for connection keep-alive.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods={"GET"},
+        ),
+    ),
+)
+
+
+def _http_get(url):
+    # Transient failures are already retried with backoff by the session adapter.
+    response = _SESSION.get(url, timeout=(3.05, 30))
+    response.raise_for_status()
+    return response
+
 
 class CPIU(DataExtractor):
     URL = "https://data.bls.gov/timeseries/CUUR0000SA0?years_option=all_years"
@@ -18,24 +47,51 @@ class CPIU(DataExtractor):
         unit="1982-84=100",
     )
 
+    _MONTHS = dict(
+        Jan=1,
+        Feb=2,
+        Mar=3,
+        Apr=4,
+        May=5,
+        Jun=6,
+        Jul=7,
+        Aug=8,
+        Sep=9,
+        Oct=10,
+        Nov=11,
+        Dec=12,
+    )
+    _MONTH_COLUMNS = list(_MONTHS)
+
     def extract(self) -> None:
         self.logger.info("Initiating the Data Extraction Method.")
-        self.df = pd.read_html(self.URL)[1]
+
+        response = _http_get(self.URL)
+
+        # Parse the page once and hand only the target table to pandas.
+        tree = lxml.html.fromstring(response.content)
+        table_html = lxml.html.tostring(tree.xpath("//table")[1]).decode()
+        self.df = pd.read_html(io.StringIO(table_html), flavor="lxml")[0]
 
     def transform(self) -> None:
         self.logger.info("Initiating the Data Transformation Method.")
-        self.df = (
-            self.df.iloc[:, :-2]
-            .melt(id_vars=["Year"], var_name="Month")
-            .assign(
-                date=lambda df: pd.to_datetime(
-                    df["Year"].astype(str) + "-" + df["Month"] + "-01",
-                    format="%Y-%b-%d",
-                )
-            )
-            .drop(columns=["Year", "Month"])
-            .assign(**self.METADATA)
+        # Keep only Year and the month columns, and clean Year on the small wide
+        # frame before it is replicated 12x by the reshape.
+        months = self._MONTH_COLUMNS
+        wide = self.df[["Year", *months]].dropna(subset=["Year"])
+        years = wide["Year"].to_numpy(dtype="int16")
+
+        # Build the long form column by column: each output array is allocated
+        # once at its final length and the frame is assembled in one shot.
+        n_years, n_months = len(years), len(months)
+        value = wide.iloc[:, 1:].to_numpy(dtype="float64").ravel()
+        year = np.repeat(years, n_months)
+        month = np.tile(
+            np.array([self._MONTHS[m] for m in months], dtype="int16"), n_years
         )
+        date = ((year - 1970) * 12 + (month - 1)).astype("datetime64[M]")
+        df = pd.DataFrame({"value": value, "date": date.astype("datetime64[ns]")})
+        self.df = self.add_metadata(df)
 
 
 class Transtrend(DataExtractor):
@@ -53,29 +109,30 @@ class Transtrend(DataExtractor):
     def extract(self):
         self.logger.info("Initiating the Data Extraction Method.")
 
-        response = requests.get(self.URL)
-        response.raise_for_status()
+        response = _http_get(self.URL)
 
-        data = response.json()
-        self.df = pd.json_normalize(
-            data,
-            record_path="returns",
-            meta=["pk", "category", "name", "is_main_index"],
-        )
+        # Only the pk == 1 index is used; build its frame straight from the
+        # returns list.
+        data = orjson.loads(response.content)
+        node = next((d for d in data if d.get("pk") == 1), None)
+        if node is None:
+            raise ValueError("Transtrend index pk == 1 not found in API response.")
+        self.df = pd.DataFrame(node["returns"])
 
     def transform(self):
         self.logger.info("Initiating the Data Transformation Method.")
 
-        self.df = (
-            self.df[self.df["pk"] == 1]
-            .copy()
-            .assign(
-                date=lambda x: pd.to_datetime(x["timestamp"], unit="ms"),
-                value=lambda x: x["monthly_return"] * 100,
-            )
-            .loc[:, ["date", "value"]]
-            .assign(**self.METADATA)
+        # Epoch-ms ints convert to datetime64 without a pandas round trip; ns
+        # matches the CPIU output's timestamp type.
+        timestamps = self.df["timestamp"].to_numpy(dtype="int64")
+        returns = self.df["monthly_return"].to_numpy(dtype="float64")
+        df = pd.DataFrame(
+            {
+                "date": timestamps.astype("datetime64[ms]").astype("datetime64[ns]"),
+                "value": returns * 100,
+            }
         )
+        self.df = self.add_metadata(df)
 
 
 def run_cpiu_etl():
@@ -92,10 +149,12 @@ def lambda_handler(event, context):
     """
     funcs = [(run_cpiu_etl, "CPIU ETL"), (run_transtrend_etl, "Transtrend ETL")]
 
-    chosen_func, func_name = random.choice(funcs)
-    chosen_func()
+    # Both pipelines are I/O-bound, so run them side by side.
+    with ThreadPoolExecutor(max_workers=len(funcs)) as executor:
+        list(executor.map(lambda func: func[0](), funcs))
 
+    func_names = ", ".join(func_name for _, func_name in funcs)
     return {
         "statusCode": 200,
-        "body": f"ETL process completed successfully. Invoked function: {func_name}",
+        "body": f"ETL process completed successfully. Invoked functions: {func_names}",
     }
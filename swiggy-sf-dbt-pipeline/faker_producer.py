@@ -1,65 +1,202 @@
 """
-Faker producer with Pydantic validation.
+Faker producer with sampled Pydantic validation.
 
-Generates batches of JSON-line events, validates each record
-using Pydantic models, and uploads gzipped JSON-lines to S3.
+Generates batches of JSON-line events, spot-checks a sample of
+records against Pydantic models, and uploads gzipped JSON-lines to S3.
 
 Install Dependencies:
-    pip install boto3 faker pydantic==2.12.3
+    pip install boto3 faker numpy pydantic==2.12.3
+    pip install orjson isal  # optional, faster JSON encoding and gzip
+
+Also runs under PyPy (pypy3 faker_producer.py), where the optional
+packages are not available and the stdlib fallbacks are used.
 """
 
-import gzip
+import io
 import json
+import multiprocessing
 import os
 import random
-import string
+import signal
 import sys
 import time
 import uuid
-from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from decimal import ROUND_HALF_UP, Decimal
-from typing import Dict, List, Literal, Optional
+from itertools import count
+from typing import Dict, List, Literal, Optional, Tuple
 
 import boto3
+import numpy as np
+from boto3.s3.transfer import TransferConfig
 from faker import Faker
-from pydantic import BaseModel, ValidationError, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
+
+try:
+    import orjson
+except ImportError:
+    # No PyPy build; the stdlib encoder is used instead (see encode_record).
+    orjson = None
+
+try:
+    # ISA-L accelerated DEFLATE with the same API as the stdlib gzip module.
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
 
 # --------------------------------------------------
 # CONFIG (env or defaults)
 # --------------------------------------------------
 S3_BUCKET = os.getenv("S3_BUCKET", "swiggy-data-generation")
 S3_PREFIX = os.getenv("S3_PREFIX", "raw/events")
-BATCH_SIZE = int(os.getenv("BATCH_SIZE", "1000000"))  # rows per file
+BATCH_SIZE = int(os.getenv("BATCH_SIZE", "1000000"))  # rows per batch
+NUM_WORKERS = int(
+    os.getenv("NUM_WORKERS", str(os.cpu_count() or 1))
+)  # part files per batch
 INTERVAL_SECONDS = float(os.getenv("INTERVAL_SECONDS", "5"))  # wait between uploads
 AWS_REGION = os.getenv("AWS_REGION", "ap-south-1")
-MAX_UNIQUENESS_ATTEMPTS = 20
+BULK_DRAW_SIZE = 65536  # values pre-drawn per NumPy RNG call
+# Fraction of generated records checked against the Pydantic models.
+VALIDATE_SAMPLE_RATE = float(os.getenv("VALIDATE_SAMPLE_RATE", "0.001"))
+MAX_UNIQUENESS_ATTEMPTS = 20  # dob redraws before a colliding customer is skipped
+# Distinct values pre-generated per Faker provider (see Faker Value Pools).
+FAKER_POOL_SIZE = int(os.getenv("FAKER_POOL_SIZE", "10000"))
 
 fake = Faker("en_IN")
+rng = np.random.default_rng()
 s3 = boto3.client("s3", region_name=AWS_REGION)
+# Multipart upload with concurrent parts for large batch files.
+transfer_config = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
+)
 
 
 # --------------------------------------------------
 # Global Uniqueness Trackers
 # --------------------------------------------------
-# It ensures that no duplicate customers / agents / restaurants / menus are included.
+# It ensures that no duplicate customers / agents are included across batches.
+# Other keys are unique by construction: emails carry a process-wide sequence number,
+# restaurants get a fresh location_id, and menu item names are distinct per restaurant.
 existing_customer_mobiles: set = set()
-existing_customer_emails: set = set()
 existing_customer_name_dob: set = set()
 existing_agent_phones: set = set()
-existing_restaurant_keys: set = set()
-existing_menu_keys: set = set()
+email_seq = count(1)
+
+# Each worker process owns one shard of the key spaces (phones, email sequence numbers,
+# birth dates), so keys stay unique across processes without any shared state.
+SHARD_ID = 0
+NUM_SHARDS = 1
 
 
 # --------------------------------------------------
 # Utilities
 # --------------------------------------------------
+class SafeISO(str):
+    """
+    An ISO-8601 timestamp string produced by now_iso(). The model validators
+    return it as-is, since it never needs to be parsed back.
+    """
+
+    __slots__ = ()
+
+
+_NOW_CACHE = (float("-inf"), SafeISO())
+
+
 def now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    # Timestamps within a batch need not differ, so the ISO string is rebuilt
+    # at most once per second.
+    global _NOW_CACHE
+    cached_at, iso = _NOW_CACHE
+    now = time.monotonic()
+    if now - cached_at >= 1.0:
+        iso = SafeISO(datetime.now(timezone.utc).isoformat())
+        _NOW_CACHE = (now, iso)
+    return iso
+
+
+def encode_record(record: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record, default=str)
+    return json.dumps(
+        record, default=str, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+def bulk_draws(draw, size: int = BULK_DRAW_SIZE):
+    """
+    Yield values produced `size` at a time by the vectorised draw(size),
+    converted to plain Python scalars (JSON-ready, no NumPy types).
+    """
+    while True:
+        yield from draw(size).tolist()
+
+
+def choice_draws(options: tuple):
+    """
+    Yield uniformly drawn elements of `options`. Indices are drawn in bulk and
+    mapped back to the shared option objects, so no value is allocated per draw.
+    """
+    for i in bulk_draws(lambda n: rng.integers(0, len(options), n)):
+        yield options[i]
+
 
+def pick(seq):
+    # random.choice equivalent backed by the bulk uniform stream.
+    return seq[int(next(unit_draws) * len(seq))]
 
-def random_phone_india() -> str:
-    # Indian phone numbers are 10 digits long, starting with 6-9.
-    return random.choice("6789") + "".join(random.choices(string.digits, k=9))
+
+def uuid_draws(size: int = BULK_DRAW_SIZE):
+    """
+    Yield canonical version-4 UUID strings sliced from one bulk os.urandom read,
+    avoiding a urandom syscall and a UUID object per id.
+    """
+    while True:
+        raw = np.frombuffer(os.urandom(16 * size), dtype=np.uint8).reshape(-1, 16)
+        raw = raw.copy()
+        raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+        raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+        h = raw.tobytes().hex()
+        for i in range(0, 32 * size, 32):
+            yield (
+                f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-"
+                f"{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+            )
+
+
+def unique_phone_draws(existing: set):
+    """
+    Yield Indian phone numbers (10 digits, starting with 6-9) not in `existing`,
+    registering each one. Candidates are drawn and de-duplicated in bulk,
+    so no per-record retry is needed.
+    """
+    while True:
+        candidates = np.unique(
+            rng.integers(6_000_000_000, 10_000_000_000, BULK_DRAW_SIZE)
+        )
+        candidates = rng.permutation(candidates[candidates % NUM_SHARDS == SHARD_ID])
+        for phone in candidates.astype("U10").tolist():
+            if phone not in existing:
+                existing.add(phone)
+                yield phone
+
+
+def random_dob() -> str:
+    # Shift back to this shard's residue class of date ordinals, so the same
+    # name+dob cannot be produced by two worker processes.
+    dob = fake.date_of_birth(minimum_age=10, maximum_age=90)
+    dob -= timedelta(days=(dob.toordinal() - SHARD_ID) % NUM_SHARDS)
+    return dob.isoformat()
 
 
 def to_decimal(v) -> Decimal:
@@ -67,6 +204,158 @@ def to_decimal(v) -> Decimal:
     return Decimal(str(v)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
 
+def format_cents(cents: int) -> str:
+    # Money is generated as int cents; this is the only conversion to a
+    # 2-decimal amount string, done when the record is emitted.
+    return f"{cents // 100}.{cents % 100:02d}"
+
+
+# --------------------------------------------------
+# Bulk Random Draws
+# --------------------------------------------------
+# Each field's random values are drawn in bulk by NumPy and handed out one by one,
+# instead of one Python-level random.* call per field per record.
+EMAIL_DOMAINS = ("gmail", "outlook", "hotmail", "icloud")
+GENDERS = ("Male", "Female", "Other")
+LOGIN_METHODS = ("OTP", "Google", "Facebook", "Email")
+SPICE_LEVELS = ("low", "medium", "high")
+YES_NO = ("Y", "N")
+ADDRESS_TYPES = ("Home", "Work")
+CUISINE_TYPES = ("Indian", "Chinese", "Italian", "Fast Food", "Mexican")
+ORDER_STATUSES = ("placed", "preparing", "on_the_way", "delivered")
+PAYMENT_METHODS = ("card", "cash", "wallet", "upi")
+VEHICLE_TYPES = ("bike", "scooter", "car")
+AGENT_STATUSES = ("available", "busy", "offline")
+DELIVERY_STATUSES = ("assigned", "picked_up", "delivered")
+LOGIN_TYPES = ("web", "mobile")
+DEVICE_INTERFACES = ("iOS", "Android", "Chrome", "Firefox")
+
+customer_phone_draws = unique_phone_draws(existing_customer_mobiles)
+agent_phone_draws = unique_phone_draws(existing_agent_phones)
+unit_draws = bulk_draws(lambda n: rng.random(n))
+id_draws = uuid_draws()
+email_domain_draws = choice_draws(EMAIL_DOMAINS)
+gender_draws = choice_draws(GENDERS)
+login_method_draws = choice_draws(LOGIN_METHODS)
+spice_level_draws = choice_draws(SPICE_LEVELS)
+flag_draws = choice_draws(YES_NO)
+address_type_draws = choice_draws(ADDRESS_TYPES)
+cuisine_type_draws = choice_draws(CUISINE_TYPES)
+order_status_draws = choice_draws(ORDER_STATUSES)
+payment_method_draws = choice_draws(PAYMENT_METHODS)
+vehicle_type_draws = choice_draws(VEHICLE_TYPES)
+agent_status_draws = choice_draws(AGENT_STATUSES)
+delivery_status_draws = choice_draws(DELIVERY_STATUSES)
+login_type_draws = choice_draws(LOGIN_TYPES)
+device_interface_draws = choice_draws(DEVICE_INTERFACES)
+coin_flip_draws = bulk_draws(lambda n: rng.random(n) < 0.5)
+address_count_draws = bulk_draws(lambda n: rng.integers(1, 3, n))
+menu_count_draws = bulk_draws(lambda n: rng.integers(3, 7, n))
+flatno_draws = bulk_draws(lambda n: rng.integers(1, 501, n).astype("U3"))
+houseno_draws = bulk_draws(lambda n: rng.integers(1, 2001, n).astype("U4"))
+floor_draws = bulk_draws(lambda n: rng.integers(0, 41, n).astype("U2"))
+pincode_draws = bulk_draws(lambda n: rng.integers(100_000, 1_000_000, n))
+# Money amounts are drawn as int cents.
+pricing_for_2_draws = bulk_draws(lambda n: rng.integers(10_000, 200_001, n))
+menu_price_draws = bulk_draws(lambda n: rng.integers(5_000, 80_001, n))
+delivery_fee_draws = bulk_draws(lambda n: rng.integers(1_000, 6_001, n))
+rating_draws = bulk_draws(lambda n: rng.uniform(1.0, 5.0, n).round(1))
+eta_minutes_draws = bulk_draws(lambda n: rng.integers(10, 41, n))
+latitude_draws = bulk_draws(lambda n: rng.uniform(-90, 90, n).round(6))
+longitude_draws = bulk_draws(lambda n: rng.uniform(-180, 180, n).round(6))
+
+
+# --------------------------------------------------
+# Vectorised Order Pricing
+# --------------------------------------------------
+MAX_ITEMS_PER_ORDER = 3
+ORDER_PLAN_SIZE = 4096  # orders planned per vectorised call
+
+
+def plan_order_items(
+    num_orders: int,
+    menu_ids: List[str],
+    menu_start: np.ndarray,
+    menu_count: np.ndarray,
+    menu_price_cents: np.ndarray,
+) -> Tuple[List[int], List[int], List[Tuple[str, int, int, int]]]:
+    """
+    Choose a restaurant and 1-3 distinct menu items for each of `num_orders`
+    orders, and price the items, in bulk. Restaurant i owns the menus
+    menu_start[i] : menu_start[i] + menu_count[i].
+
+    Returns each order's restaurant index and item count, and the
+    (menu_id, quantity, price_cents, subtotal_cents) lines of all orders in order.
+    """
+    rest = rng.integers(0, len(menu_start), num_orders)
+    counts = menu_count[rest]
+    num_items = 1 + (
+        rng.random(num_orders) * np.minimum(MAX_ITEMS_PER_ORDER, counts)
+    ).astype(np.int64)
+
+    # Distinct menus per order: rank random keys over the restaurant's menu slots.
+    keys = rng.random((num_orders, int(menu_count.max())))
+    keys[np.arange(keys.shape[1]) >= counts[:, None]] = np.inf
+    slots = np.argsort(keys, axis=1)[:, :MAX_ITEMS_PER_ORDER]
+    taken = np.arange(slots.shape[1]) < num_items[:, None]
+    item_menu = (menu_start[rest][:, None] + slots)[taken]
+
+    qty = rng.integers(1, 4, item_menu.size)
+    price = menu_price_cents[item_menu]
+    subtotal = price * qty
+    lines = list(
+        zip(
+            [menu_ids[i] for i in item_menu.tolist()],
+            qty.tolist(),
+            price.tolist(),
+            subtotal.tolist(),
+        )
+    )
+    return rest.tolist(), num_items.tolist(), lines
+
+
+# --------------------------------------------------
+# Faker Value Pools
+# --------------------------------------------------
+# Text fields are sampled from values generated once at import, rather than
+# dispatching through a Faker provider for every record.
+def faker_pool(provider, size: int = FAKER_POOL_SIZE) -> tuple:
+    return tuple(provider() for _ in range(size))
+
+
+def full_name_draws():
+    # Names combine independent first and last name draws, so the name space
+    # (part of the customer name+dob key) is the product of the two pools
+    # rather than FAKER_POOL_SIZE full names.
+    for first, last in zip(choice_draws(FIRST_NAME_POOL), choice_draws(LAST_NAME_POOL)):
+        yield f"{first} {last}"
+
+
+FIRST_NAME_POOL = faker_pool(fake.first_name)
+LAST_NAME_POOL = faker_pool(fake.last_name)
+COMPANY_POOL = faker_pool(fake.company)
+CITY_POOL = faker_pool(fake.city)
+STATE_POOL = faker_pool(fake.state)
+STREET_NAME_POOL = faker_pool(fake.street_name)
+STREET_ADDRESS_POOL = faker_pool(fake.street_address)
+CITY_SUFFIX_POOL = faker_pool(fake.city_suffix)
+SENTENCE_POOL = faker_pool(lambda: fake.sentence(nb_words=8))
+USER_AGENT_POOL = faker_pool(fake.user_agent)
+# The en_IN locale has no food provider, in which case every item is an "Item".
+FOOD_POOL = faker_pool(fake.food) if hasattr(fake, "food") else ("Item",)
+
+name_draws = full_name_draws()
+company_draws = choice_draws(COMPANY_POOL)
+city_draws = choice_draws(CITY_POOL)
+state_draws = choice_draws(STATE_POOL)
+street_name_draws = choice_draws(STREET_NAME_POOL)
+street_address_draws = choice_draws(STREET_ADDRESS_POOL)
+city_suffix_draws = choice_draws(CITY_SUFFIX_POOL)
+sentence_draws = choice_draws(SENTENCE_POOL)
+user_agent_draws = choice_draws(USER_AGENT_POOL)
+food_draws = choice_draws(FOOD_POOL)
+
+
 # --------------------------------------------------
 # Pydantic Models & Validators
 # --------------------------------------------------
@@ -92,6 +381,9 @@ class CustomerModel(BaseModel):
     @field_validator("created_date", "dob", mode="before")
     @classmethod
     def validate_iso(cls, v: str) -> str:
+        # Timestamps from now_iso() are valid by construction.
+        if type(v) is SafeISO:
+            return v
         if v is None:
             return v
         try:
@@ -141,6 +433,9 @@ class AddressModel(BaseModel):
     @field_validator("created_date", mode="before")
     @classmethod
     def validate_iso(cls, v: str) -> str:
+        # Timestamps from now_iso() are valid by construction.
+        if type(v) is SafeISO:
+            return v
         try:
             datetime.fromisoformat(v.replace("Z", "+00:00"))
         except Exception:
@@ -160,6 +455,9 @@ class LocationModel(BaseModel):
     @field_validator("created_date", mode="before")
     @classmethod
     def validate_iso(cls, v: str) -> str:
+        # Timestamps from now_iso() are valid by construction.
+        if type(v) is SafeISO:
+            return v
         try:
             datetime.fromisoformat(v.replace("Z", "+00:00"))
         except Exception:
@@ -196,6 +494,9 @@ class RestaurantModel(BaseModel):
     @field_validator("created_date", mode="before")
     @classmethod
     def validate_iso(cls, v: str) -> str:
+        # Timestamps from now_iso() are valid by construction.
+        if type(v) is SafeISO:
+            return v
         try:
             datetime.fromisoformat(v.replace("Z", "+00:00"))
         except Exception:
@@ -233,6 +534,9 @@ class MenuModel(BaseModel):
     @field_validator("created_date", mode="before")
     @classmethod
     def validate_iso(cls, v: str) -> str:
+        # Timestamps from now_iso() are valid by construction.
+        if type(v) is SafeISO:
+            return v
         try:
             datetime.fromisoformat(v.replace("Z", "+00:00"))
         except Exception:
@@ -290,6 +594,9 @@ class OrderModel(BaseModel):
     @field_validator("order_date", "created_date", mode="before")
     @classmethod
     def validate_iso(cls, v: str) -> str:
+        # Timestamps from now_iso() are valid by construction.
+        if type(v) is SafeISO:
+            return v
         try:
             datetime.fromisoformat(v.replace("Z", "+00:00"))
         except Exception:
@@ -336,6 +643,9 @@ class DeliveryAgentModel(BaseModel):
     @field_validator("created_date", mode="before")
     @classmethod
     def validate_iso(cls, v: str) -> str:
+        # Timestamps from now_iso() are valid by construction.
+        if type(v) is SafeISO:
+            return v
         try:
             datetime.fromisoformat(v.replace("Z", "+00:00"))
         except Exception:
@@ -357,6 +667,9 @@ class DeliveryModel(BaseModel):
     @field_validator("delivery_date", "created_date", mode="before")
     @classmethod
     def validate_iso(cls, v: str) -> str:
+        # Timestamps from now_iso() are valid by construction.
+        if type(v) is SafeISO:
+            return v
         if v is None:
             return v
         try:
@@ -379,6 +692,9 @@ class LoginAuditModel(BaseModel):
     @field_validator("lastlogin", mode="before")
     @classmethod
     def lastlogin_ok(cls, v):
+        # Timestamps from now_iso() are valid by construction.
+        if type(v) is SafeISO:
+            return v
         try:
             datetime.fromisoformat(v.replace("Z", "+00:00"))
         except Exception:
@@ -386,27 +702,57 @@ class LoginAuditModel(BaseModel):
         return v
 
 
+# Compiled validators, built once so each call skips schema re-resolution.
+VALIDATORS: Dict[type, TypeAdapter] = {
+    model_cls: TypeAdapter(model_cls)
+    for model_cls in (
+        CustomerModel,
+        AddressModel,
+        LocationModel,
+        RestaurantModel,
+        MenuModel,
+        OrderItemModel,
+        OrderModel,
+        DeliveryAgentModel,
+        DeliveryModel,
+        LoginAuditModel,
+    )
+}
+
+
 # --------------------------------------------------
 # Generator functions using Faker + Validation
 # --------------------------------------------------
-def make_customer_candidate(customer_id=None) -> dict:
-    cid = customer_id or str(uuid.uuid4())
-    name = fake.name()
-    domain = random.choice(["gmail", "outlook", "hotmail", "icloud"])
-    email = f"{name.lower().strip()}{str(random.randint(1, 9999))}@{domain}.com"
+def make_customer_candidate(customer_id=None) -> Optional[dict]:
+    cid = customer_id or next(id_draws)
+    name = next(name_draws)
+    domain = next(email_domain_draws)
+    email = f"{name.lower().strip()}{next(email_seq)}@{domain}.com"
+
+    # Mobile and email are unique by construction; only name+dob can collide,
+    # in which case just the dob is redrawn, up to MAX_UNIQUENESS_ATTEMPTS times.
+    name_key = name.strip().lower()
+    for _ in range(MAX_UNIQUENESS_ATTEMPTS):
+        dob = random_dob()
+        if (name_key, dob) not in existing_customer_name_dob:
+            break
+    else:
+        print("[WARNING] Unable to create a unique customer after attempts; skipping.")
+        return None
+    existing_customer_name_dob.add((name_key, dob))
 
     payload = {
         "type": "customer",
         "customer_id": cid,
         "name": name,
-        "mobile": random_phone_india(),
+        "mobile": next(customer_phone_draws),
         "email": email,
-        "loginbyusing": random.choice(["OTP", "Google", "Facebook", "Email"]),
-        "gender": random.choice(["Male", "Female", "Other"]),
-        "dob": fake.date_of_birth(minimum_age=10, maximum_age=90).isoformat(),
+        "loginbyusing": next(login_method_draws),
+        "gender": next(gender_draws),
+        "dob": dob,
         "preferences": {
-            "vegan": random.choice([True, False]),
-            "spicy": random.choice(["low", "medium", "high"]),
+            "vegan": next(coin_flip_draws),
+            "spicy": next(spice_level_draws),
         },
         "created_date": now_iso(),
     }
@@ -415,185 +761,117 @@ def make_customer_candidate(customer_id=None) -> dict:
 
 def make_customer_unique(customer_id: Optional[str] = None) -> Optional[dict]:
     """
-    Create a customer ensuring uniqueness on mobile and email (and name+dob).
-    If collisions occur, try regenerating up to MAX_UNIQUENESS_ATTEMPTS.
+    Create a customer, unique on mobile and email by construction and on
+    name+dob by bounded dob redraws. Returns None if no free dob was found.
     """
-    for _ in range(MAX_UNIQUENESS_ATTEMPTS):
-        payload = make_customer_candidate(customer_id)
-        mobile = payload["mobile"]
-        email = payload["email"].lower()
-        name_dob = (payload["name"].strip().lower(), payload["dob"])
-
-        # If mobile or email already exists, regenerate fields rather than creating duplicates.
-        if (
-            mobile in existing_customer_mobiles
-            or email in existing_customer_emails
-            or name_dob in existing_customer_name_dob
-        ):
-            continue
-
-        valid = validate_or_log(payload, CustomerModel)
-        if not valid:
-            continue
-
-        # Register uniqueness.
-        existing_customer_mobiles.add(valid["mobile"])
-        existing_customer_emails.add(valid["email"].lower())
-        existing_customer_name_dob.add(
-            (valid["name"].strip().lower(), valid.get("dob"))
-        )
-        return valid
-
-    print("[WARNING] Unable to create a unique customer after attempts; skipping.")
-    return None
+    payload = make_customer_candidate(customer_id)
+    if payload is None:
+        return None
+    return sample_validate(payload, CustomerModel)
 
 
 def make_address(customer_id):
     payload = {
         "type": "customeraddressbook",
-        "address_id": str(uuid.uuid4()),
+        "address_id": next(id_draws),
         "customer_id": customer_id,
-        "flatno": str(random.randint(1, 500)),
-        "houseno": str(random.randint(1, 2000)),
-        "floor": random.randint(0, 40),
-        "building": fake.street_name(),
-        "landmark": fake.street_address(),
-        "coordinates": f"{fake.latitude()},{fake.longitude()}",
-        "primaryflag": random.choice(["Y", "N"]),
-        "address_type": random.choice(["Home", "Work"]),
-        "locality": fake.city_suffix(),
-        "city": fake.city(),
-        "state": fake.state(),
-        "pincode": (
-            int(fake.postcode())
-            if fake.postcode().isdigit() and len(fake.postcode()) == 6
-            else random.randint(100000, 999999)
-        ),
+        "flatno": next(flatno_draws),
+        "houseno": next(houseno_draws),
+        "floor": next(floor_draws),
+        "building": next(street_name_draws),
+        "landmark": next(street_address_draws),
+        "coordinates": f"{next(latitude_draws)},{next(longitude_draws)}",
+        "primaryflag": next(flag_draws),
+        "address_type": next(address_type_draws),
+        "locality": next(city_suffix_draws),
+        "city": next(city_draws),
+        "state": next(state_draws),
+        "pincode": next(pincode_draws),
         "created_date": now_iso(),
     }
-    return validate_or_log(payload, AddressModel)
+    return sample_validate(payload, AddressModel)
 
 
 def make_location():
     payload = {
         "type": "location",
-        "location_id": str(uuid.uuid4()),
-        "city": fake.city(),
-        "state": fake.state(),
-        "zipcode": (
-            fake.postcode()
-            if fake.postcode().isdigit() and len(fake.postcode()) == 6
-            else str(random.randint(100000, 999999))
-        ),
-        "activeflag": random.choice(["Y", "N"]),
+        "location_id": next(id_draws),
+        "city": next(city_draws),
+        "state": next(state_draws),
+        "zipcode": str(next(pincode_draws)),
+        "activeflag": next(flag_draws),
         "created_date": now_iso(),
     }
-    return validate_or_log(payload, LocationModel)
+    return sample_validate(payload, LocationModel)
 
 
 def make_restaurant_unique() -> Optional[dict]:
     """
-    Create a restaurant ensuring uniqueness on (name, location_id).
+    Create a restaurant. (name, location_id) is unique by construction,
+    since every restaurant gets a fresh location_id.
     """
-    for _ in range(MAX_UNIQUENESS_ATTEMPTS):
-        location_id = str(uuid.uuid4())
-        name = fake.company()
-        key = (name.strip().lower(), location_id)
-        if key in existing_restaurant_keys:
-            continue
-
-        payload = {
-            "type": "restaurant",
-            "restaurant_id": str(uuid.uuid4()),
-            "name": name,
-            "cuisine_type": random.choice(
-                ["Indian", "Chinese", "Italian", "Fast Food", "Mexican"]
-            ),
-            "pricing_for_2": str(round(random.uniform(100, 2000), 2)),
-            "location_id": location_id,
-            "created_date": now_iso(),
-        }
-        valid = validate_or_log(payload, RestaurantModel)
-        if not valid:
-            continue
-
-        existing_restaurant_keys.add(
-            (valid["name"].strip().lower(), valid["location_id"])
-        )
-        return valid
-
-    print("[WARNING] Unable to create a unique restaurant after attempts; skipping.")
-    return None
+    payload = {
+        "type": "restaurant",
+        "restaurant_id": next(id_draws),
+        "name": next(company_draws),
+        "cuisine_type": next(cuisine_type_draws),
+        "pricing_for_2": format_cents(next(pricing_for_2_draws)),
+        "location_id": next(id_draws),
+        "created_date": now_iso(),
+    }
+    return sample_validate(payload, RestaurantModel)
 
 
-def make_menu_unique(restaurant_id: str) -> Optional[dict]:
+def make_menu_unique(restaurant_id: str, word: str, price_cents: int) -> Optional[dict]:
     """
-    Create a menu item ensuring uniqueness on (restaurant_id, itemname).
+    Create a menu item named after `word`. Callers pass distinct words per
+    restaurant, so (restaurant_id, itemname) is unique by construction.
     """
-    for _ in range(MAX_UNIQUENESS_ATTEMPTS):
-        itemname = (
-            fake.word().title() + " " + (getattr(fake, "food", lambda: "Item")())
-        ).strip()
-        key = (restaurant_id, itemname.strip().lower())
-        if key in existing_menu_keys:
-            continue
-
-        payload = {
-            "type": "menu",
-            "menu_id": str(uuid.uuid4()),
-            "restaurant_id": restaurant_id,
-            "itemname": itemname,
-            "description": fake.sentence(nb_words=8),
-            "price": str(round(random.uniform(50, 800), 2)),
-            "activeflag": random.choice(["Y", "N"]),
-            "created_date": now_iso(),
-        }
-        valid = validate_or_log(payload, MenuModel)
-        if not valid:
-            continue
-
-        existing_menu_keys.add(
-            (valid["restaurant_id"], valid["itemname"].strip().lower())
-        )
-        return valid
-
-    print("[WARNING] Unable to create a unique menu item after attempts; skipping.")
-    return None
+    itemname = (word.title() + " " + next(food_draws)).strip()
+    payload = {
+        "type": "menu",
+        "menu_id": next(id_draws),
+        "restaurant_id": restaurant_id,
+        "itemname": itemname,
+        "description": next(sentence_draws),
+        "price": format_cents(price_cents),
+        "activeflag": next(flag_draws),
+        "created_date": now_iso(),
+    }
+    return sample_validate(payload, MenuModel)
 
 
-def make_order_with_items(customer_id, restaurant_id, menus_for_rest):
-    order_id = str(uuid.uuid4())
-    if not menus_for_rest:
+def make_order_with_items(customer_id, restaurant_id, lines):
+    """
+    Create an order and its items from `lines`, the (menu_id, quantity,
+    price_cents, subtotal_cents) tuples priced by plan_order_items().
+    """
+    order_id = next(id_draws)
+    if not lines:
         return None, []
 
-    chosen = random.sample(
-        menus_for_rest, k=random.randint(1, min(3, len(menus_for_rest)))
-    )
     items = []
 
-    for menu_item in chosen:
-        qty = random.randint(1, 3)
-        price = Decimal(str(menu_item["price"]))
-        subtotal = (price * qty).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    total_cents = 0
+    for menu_id, qty, price_cents, subtotal_cents in lines:
         itm_payload = {
             "type": "orderitem",
-            "orderitem_id": str(uuid.uuid4()),
+            "orderitem_id": next(id_draws),
             "order_id": order_id,
-            "menu_id": menu_item["menu_id"],
+            "menu_id": menu_id,
             "quantity": qty,
-            "price": str(price),
-            "subtotal": str(subtotal),
+            "price": format_cents(price_cents),
+            "subtotal": format_cents(subtotal_cents),
         }
-        itm_valid = validate_or_log(itm_payload, OrderItemModel)
+        itm_valid = sample_validate(itm_payload, OrderItemModel)
         if itm_valid:
             items.append(itm_valid)
+            total_cents += subtotal_cents
 
     if not items:
         return None, []
 
-    total = sum(Decimal(itm["subtotal"]) for itm in items) + to_decimal(
-        random.uniform(10, 60)
-    )
+    total_cents += next(delivery_fee_draws)
 
     order_payload = {
         "type": "orders",
@@ -601,94 +879,86 @@ def make_order_with_items(customer_id, restaurant_id, menus_for_rest):
         "customer_id": customer_id,
         "restaurant_id": restaurant_id,
         "order_date": now_iso(),
-        "totalamount": str(total),
-        "status": random.choice(["placed", "preparing", "on_the_way", "delivered"]),
-        "paymentmethod": random.choice(["card", "cash", "wallet", "upi"]),
+        "totalamount": format_cents(total_cents),
+        "status": next(order_status_draws),
+        "paymentmethod": next(payment_method_draws),
         "created_date": now_iso(),
     }
-    order_valid = validate_or_log(order_payload, OrderModel)
+    order_valid = sample_validate(order_payload, OrderModel)
     return order_valid, items
 
 
 def make_deliveryagent_unique() -> Optional[dict]:
     """
-    Create a delivery agent ensuring phone uniqueness.
+    Create a delivery agent, unique on phone by construction.
     """
-    for _ in range(MAX_UNIQUENESS_ATTEMPTS):
-        phone = random_phone_india()
-        if phone in existing_agent_phones:
-            continue
-
-        payload = {
-            "type": "deliveryagent",
-            "deliveryagent_id": str(uuid.uuid4()),
-            "name": fake.name(),
-            "phone": phone,
-            "vehicle_type": random.choice(["bike", "scooter", "car"]),
-            "location_id": str(uuid.uuid4()),
-            "status": random.choice(["available", "busy", "offline"]),
-            "rating": str(round(random.uniform(1.0, 5.0), 1)),
-            "created_date": now_iso(),
-        }
-        valid = validate_or_log(payload, DeliveryAgentModel)
-        if not valid:
-            continue
-
-        existing_agent_phones.add(valid["phone"])
-        return valid
-
-    print(
-        "[WARNING] Unable to create a unique delivery agent after attempts; skipping."
-    )
-    return None
+    payload = {
+        "type": "deliveryagent",
+        "deliveryagent_id": next(id_draws),
+        "name": next(name_draws),
+        "phone": next(agent_phone_draws),
+        "vehicle_type": next(vehicle_type_draws),
+        "location_id": next(id_draws),
+        "status": next(agent_status_draws),
+        "rating": f"{next(rating_draws):.2f}",
+        "created_date": now_iso(),
+    }
+    return sample_validate(payload, DeliveryAgentModel)
 
 
 def make_delivery(order_id, deliveryagent_id, address_id):
     payload = {
         "type": "delivery",
-        "delivery_id": str(uuid.uuid4()),
+        "delivery_id": next(id_draws),
         "order_id": order_id,
         "deliveryagent_id": deliveryagent_id,
-        "deliverystatus": random.choice(["assigned", "picked_up", "delivered"]),
-        "estimated_time": f"00:{random.randint(10,40):02d}:00",
+        "deliverystatus": next(delivery_status_draws),
+        "estimated_time": f"00:{next(eta_minutes_draws):02d}:00",
         "address_id": address_id,
         "delivery_date": now_iso(),
         "created_date": now_iso(),
     }
-    return validate_or_log(payload, DeliveryModel)
+    return sample_validate(payload, DeliveryModel)
 
 
 def make_loginaudit(customer_id):
     payload = {
         "type": "loginaudit",
-        "login_id": str(uuid.uuid4()),
+        "login_id": next(id_draws),
         "customer_id": customer_id,
-        "logintype": random.choice(["web", "mobile"]),
-        "deviceinterface": random.choice(["iOS", "Android", "Chrome", "Firefox"]),
-        "mobiledevicename": fake.user_agent(),
-        "webinterface": fake.user_agent(),
+        "logintype": next(login_type_draws),
+        "deviceinterface": next(device_interface_draws),
+        "mobiledevicename": next(user_agent_draws),
+        "webinterface": next(user_agent_draws),
         "lastlogin": now_iso(),
     }
-    return validate_or_log(payload, LoginAuditModel)
+    return sample_validate(payload, LoginAuditModel)
 
 
 # --------------------------------------------------
-# Validation Helper
+# Validation Helpers
 # --------------------------------------------------
+def sample_validate(payload: dict, model_cls):
+    """
+    Generated payloads are valid by construction, so only a sample
+    (VALIDATE_SAMPLE_RATE) is checked against model_cls.
+    Unsampled payloads are returned as-is.
+    """
+    if next(unit_draws) >= VALIDATE_SAMPLE_RATE:
+        return payload
+    return validate_or_log(payload, model_cls)
+
+
 def validate_or_log(payload: dict, model_cls):
     """
     Attempt to validate payload with model_cls.
-    If valid, return model.dict() (with native types like Decimal -> str for JSON).
+    If valid, return the payload itself: it is already JSON-ready, with
+    amounts rendered as 2-decimal strings where it is built.
     If invalid, log and return None.
     """
     try:
-        model = model_cls.model_validate(payload)
-        d = model.model_dump()
-        # Convert top-level Decimal to string for JSON compatibility.
-        for k, v in list(d.items()):
-            if isinstance(v, Decimal):
-                d[k] = format(v, "f")
-        return d
+        VALIDATORS[model_cls].validate_python(payload)
+        return payload
     except ValidationError as exc:
         print(
             f"[VALIDATION FAILED] model={model_cls.__name__} id={payload.get(list(payload.keys())[1], 'unknown')} errors={exc.errors()}",
@@ -697,157 +967,274 @@ def validate_or_log(payload: dict, model_cls):
         return None
 
 
+# --------------------------------------------------
+# Streaming Record Sink
+# --------------------------------------------------
+class GzipJsonlSink:
+    """
+    Newline-delimited JSON compressed as records are produced, so a batch is
+    only ever held in memory as its gzip bytes. Compression runs on a
+    background thread (DEFLATE releases the GIL) while the next chunk is built.
+    """
+
+    # Records are encoded one by one but handed to the compressor in chunks.
+    FLUSH_RECORDS = 4096
+
+    def __init__(self) -> None:
+        self._buffer = io.BytesIO()
+        # Level 1 trades a little ratio on very redundant JSON for much faster compression.
+        self._gz = gzip.GzipFile(fileobj=self._buffer, mode="wb", compresslevel=1)
+        # Pre-sized chunk buffer filled by index; the extra trailing b"" makes
+        # the join end with a newline.
+        self._pending: List[bytes] = [b""] * (self.FLUSH_RECORDS + 1)
+        self._filled = 0
+        self.count = 0
+        # Single compression slot: at most one chunk is in flight.
+        self._compressor = ThreadPoolExecutor(max_workers=1)
+        self._compressing = None
+
+    def write(self, record: dict) -> None:
+        self._pending[self._filled] = encode_record(record)
+        self._filled += 1
+        self.count += 1
+        if self._filled == self.FLUSH_RECORDS:
+            self._compress(b"\n".join(self._pending))
+            self._filled = 0
+
+    def _compress(self, chunk: bytes) -> None:
+        if self._compressing is not None:
+            self._compressing.result()
+        self._compressing = self._compressor.submit(self._gz.write, chunk)
+
+    def _flush(self) -> None:
+        if self._filled:
+            self._compress(b"\n".join(self._pending[: self._filled]) + b"\n")
+            self._filled = 0
+
+    def close(self) -> bytes:
+        self._flush()
+        if self._compressing is not None:
+            self._compressing.result()
+        self._compressor.shutdown()
+        self._gz.close()
+        return self._buffer.getvalue()
+
+    def __enter__(self) -> "GzipJsonlSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        # Stop the compressor thread even if the batch failed before close().
+        self._compressor.shutdown()
+
+
 # --------------------------------------------------
 # Batch Builder & Uploader
 # --------------------------------------------------
-def build_batch(batch_size: int) -> List[dict]:
-    rows: List[dict] = []
+def build_batch(batch_size: int, sink: GzipJsonlSink) -> int:
+    """
+    Generate about `batch_size` records into `sink` and return how many were
+    written. Only the ids that orders reference are kept in memory.
+    """
+    start = sink.count
 
     # Create stable pools (each entity is produced once and reused).
     num_customers = max(10, batch_size // 20)
     num_restaurants = max(5, batch_size // 50)
     num_agents = max(5, batch_size // 50)
 
-    customers: List[dict] = []
-
     # Generate unique customers.
+    customer_ids: List[str] = []
     attempts = 0
-    while len(customers) < num_customers and attempts < num_customers * 10:
+    while len(customer_ids) < num_customers and attempts < num_customers * 10:
         attempts += 1
         c = make_customer_unique()
         if c:
-            customers.append(c)
-            rows.append(c)
-
-    addresses: List[dict] = []
-    for c in customers:
+            sink.write(c)
+            customer_ids.append(c["customer_id"])
+
+    address_ids: List[str] = []
+    # Address ids per customer, so deliveries look up a customer's addresses
+    # directly instead of scanning every address.
+    addresses_by_customer: Dict[str, List[str]] = {}
+    for customer_id in customer_ids:
         # Create 1-2 addresses per customer.
-        for _ in range(random.randint(1, 2)):
-            a = make_address(c["customer_id"])
+        cust_addresses: List[str] = []
+        for _ in range(next(address_count_draws)):
+            a = make_address(customer_id)
             if a:
-                addresses.append(a)
-                rows.append(a)
+                sink.write(a)
+                cust_addresses.append(a["address_id"])
+        if cust_addresses:
+            addresses_by_customer[customer_id] = cust_addresses
+            address_ids.extend(cust_addresses)
         # Occasional login events.
-        if random.random() < 0.4:
-            la = make_loginaudit(c["customer_id"])
+        if next(unit_draws) < 0.4:
+            la = make_loginaudit(customer_id)
             if la:
-                rows.append(la)
+                sink.write(la)
 
-    restaurants: List[dict] = []
+    restaurant_ids: List[str] = []
     for _ in range(num_restaurants):
         r = make_restaurant_unique()
         if r:
-            restaurants.append(r)
-            rows.append(r)
-
-    menus: Dict[str, List[dict]] = {}
-    for r in restaurants:
-        mlist: List[dict] = []
-        # Generate unique menus per restaurant.
-        for _ in range(random.randint(3, 6)):
-            m = make_menu_unique(r["restaurant_id"])
+            sink.write(r)
+            restaurant_ids.append(r["restaurant_id"])
+
+    # Menus that orders pick from, stored contiguously per restaurant
+    # (in restaurant_ids order) for plan_order_items().
+    menu_ids: List[str] = []
+    menu_prices: List[int] = []
+    menu_start: List[int] = []
+    for restaurant_id in restaurant_ids:
+        menu_start.append(len(menu_ids))
+        # Generate unique menus per restaurant from distinct words.
+        for word in fake.words(nb=next(menu_count_draws), unique=True):
+            price_cents = next(menu_price_draws)
+            m = make_menu_unique(restaurant_id, word, price_cents)
             if m:
-                mlist.append(m)
-                rows.append(m)
-        if not mlist:
+                menu_ids.append(m["menu_id"])
+                menu_prices.append(price_cents)
+                sink.write(m)
+        if len(menu_ids) == menu_start[-1]:
             # Fallback single menu.
             fallback = {
                 "type": "menu",
-                "menu_id": str(uuid.uuid4()),
-                "restaurant_id": r["restaurant_id"],
+                "menu_id": next(id_draws),
+                "restaurant_id": restaurant_id,
                 "itemname": "Basic Item",
                 "description": "auto-created",
                 "price": "100.00",
                 "activeflag": "Y",
                 "created_date": now_iso(),
             }
-            # Register fallback key to keep global uniqueness consistent.
-            existing_menu_keys.add(
-                (fallback["restaurant_id"], fallback["itemname"].strip().lower())
-            )
-            mlist.append(fallback)
-            rows.append(fallback)
-        menus[r["restaurant_id"]] = mlist
-
-    agents: List[dict] = []
+            menu_ids.append(fallback["menu_id"])
+            menu_prices.append(10_000)
+            sink.write(fallback)
+    menu_start_arr = np.array(menu_start, dtype=np.int64)
+    menu_count_arr = np.diff(np.append(menu_start_arr, len(menu_ids)))
+    menu_price_arr = np.array(menu_prices, dtype=np.int64)
+
+    agent_ids: List[str] = []
     for _ in range(num_agents):
         a = make_deliveryagent_unique()
         if a:
-            agents.append(a)
-            rows.append(a)
+            sink.write(a)
+            agent_ids.append(a["deliveryagent_id"])
 
     # Create orders until we reach the desired approximate batch size.
     # Note: Orders produce multiple rows (order, order items, and optional delivery).
+    # Order groups are never split, so the batch may overshoot by one group.
     attempts = 0
-    while len(rows) < batch_size and attempts < batch_size * 10:
-        attempts += 1
-        cust = random.choice(customers)
-        rest = random.choice(restaurants)
-        rest_menus = menus.get(rest["restaurant_id"], [])
-        order_valid, items = make_order_with_items(
-            cust["customer_id"], rest["restaurant_id"], rest_menus
+    while sink.count - start < batch_size and attempts < batch_size * 10:
+        # Every order adds at least two rows, which bounds the orders still needed.
+        num_orders = min(ORDER_PLAN_SIZE, (batch_size - sink.count + start) // 2 + 1)
+        rest_idx, item_counts, lines = plan_order_items(
+            num_orders, menu_ids, menu_start_arr, menu_count_arr, menu_price_arr
         )
-        if order_valid:
-            rows.append(order_valid)
-            rows.extend(items)
-
-            # Optionally create a delivery for the order. Reuse delivery agents.
-            if random.random() < 0.6 and agents:
-                cust_addresses = [
-                    a for a in addresses if a["customer_id"] == cust["customer_id"]
-                ]
-                address_id = None
-                if cust_addresses:
-                    address_id = random.choice(cust_addresses)["address_id"]
-                elif addresses:
-                    address_id = random.choice(addresses)["address_id"]
-
-                agent = random.choice(agents)
-                if address_id:
-                    delivery_rec = make_delivery(
-                        order_valid["order_id"], agent["deliveryagent_id"], address_id
+        line = 0
+        for r, k in zip(rest_idx, item_counts):
+            if sink.count - start >= batch_size or attempts >= batch_size * 10:
+                break
+            attempts += 1
+            customer_id = pick(customer_ids)
+            order_valid, items = make_order_with_items(
+                customer_id, restaurant_ids[r], lines[line : line + k]
+            )
+            line += k
+            if order_valid:
+                sink.write(order_valid)
+                for itm in items:
+                    sink.write(itm)
+
+                # Optionally create a delivery for the order. Reuse delivery agents.
+                if next(unit_draws) < 0.6 and agent_ids:
+                    cust_addresses = (
+                        addresses_by_customer.get(customer_id) or address_ids
                     )
-                    if delivery_rec:
-                        rows.append(delivery_rec)
-
-    # If we overshot, slice to the requested size (this may cut an entity group mid-way).
-    # If group integrity is required (i.e., order and its items), consider not slicing and instead
-    # adjust the loop to account for the group size. Currently, we slice to ensure file size.
-    if len(rows) > batch_size:
-        return rows[:batch_size]
+                    address_id = pick(cust_addresses) if cust_addresses else None
 
-    return [r for r in rows if r is not None]
+                    agent_id = pick(agent_ids)
+                    if address_id:
+                        delivery_rec = make_delivery(
+                            order_valid["order_id"], agent_id, address_id
+                        )
+                        if delivery_rec:
+                            sink.write(delivery_rec)
 
+    return sink.count - start
 
-def upload_batch_to_s3(rows: List[dict]):
-    if not rows:
-        raise Exception("No valid rows to upload")
 
+def upload_part_to_s3(gz: bytes, num_rows: int):
     datepart = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     hourpart = datetime.now(timezone.utc).strftime("%H")
     key = f"{S3_PREFIX}/date={datepart}/hour={hourpart}/part-{uuid.uuid4().hex}.json.gz"
 
-    # Prepare gzipped newline JSON.
-    body_lines = []
-    for r in rows:
-        body_lines.append(json.dumps(r, default=str))
+    s3.upload_fileobj(
+        io.BytesIO(gz),
+        S3_BUCKET,
+        key,
+        ExtraArgs={"ContentType": "application/gzip"},
+        Config=transfer_config,
+    )
+    print(f"Uploaded {num_rows} records to s3://{S3_BUCKET}/{key}")
+
+
+def upload_parts_to_s3(parts: List[Tuple[bytes, int]]):
+    for gz, num_rows in parts:
+        upload_part_to_s3(gz, num_rows)
 
-    body = ("\n".join(body_lines)).encode("utf-8")
-    gz = gzip.compress(body)
-    s3.put_object(Bucket=S3_BUCKET, Key=key, Body=gz, ContentType="application/gzip")
-    print(f"Uploaded {len(rows)} validated records to s3://{S3_BUCKET}/{key}")
+
+# --------------------------------------------------
+# Worker Processes
+# --------------------------------------------------
+def init_worker(shard_counter, num_shards: int) -> None:
+    """
+    Claim the next shard id and reseed every RNG, since forked workers
+    would otherwise replay the parent's random streams.
+    """
+    global SHARD_ID, NUM_SHARDS, email_seq, rng
+    # Ctrl-C is handled by the main process only.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    with shard_counter.get_lock():
+        SHARD_ID = shard_counter.value
+        shard_counter.value += 1
+    NUM_SHARDS = num_shards
+    email_seq = count(SHARD_ID + 1, num_shards)
+    rng = np.random.default_rng()
+    random.seed()
+    fake.seed_instance(random.getrandbits(64))
+
+
+def build_shard(batch_size: int) -> Tuple[bytes, int]:
+    with GzipJsonlSink() as sink:
+        num_rows = build_batch(batch_size, sink)
+        gz = sink.close()
+    if not num_rows:
+        raise Exception("No valid rows to upload")
+    return gz, num_rows
 
 
 # --------------------------------------------------
 # Main loop
 # --------------------------------------------------
 def main():
-    print("Starting faker producer with Pydantic validation. Ctrl-C to stop.")
+    print("Starting faker producer with sampled Pydantic validation. Ctrl-C to stop.")
+    # Each batch is generated as NUM_WORKERS shards in parallel, one part file each.
+    shard_size = -(-BATCH_SIZE // NUM_WORKERS)
+    # Single background upload slot: the next batch is built while the previous uploads.
+    upload = None
     try:
-        while True:
-            rows = build_batch(BATCH_SIZE)
-            upload_batch_to_s3(rows)
-            time.sleep(INTERVAL_SECONDS)
+        with ProcessPoolExecutor(
+            max_workers=NUM_WORKERS,
+            initializer=init_worker,
+            initargs=(multiprocessing.Value("i", 0), NUM_WORKERS),
+        ) as pool, ThreadPoolExecutor(max_workers=1) as uploader:
+            while True:
+                parts = list(pool.map(build_shard, [shard_size] * NUM_WORKERS))
+                if upload is not None:
+                    upload.result()
+                upload = uploader.submit(upload_parts_to_s3, parts)
+                time.sleep(INTERVAL_SECONDS)
     except KeyboardInterrupt:
         print("Stopped by User")
 